@@ -211,4 +211,7 @@ AWS_S3_OBJECT_PARAMETERS = {
 DEFAULT_FILE_STORAGE = 'buildly.storage_backends.MediaStorage'
 AWS_URL_LINK = os.getenv('AWS_URL_LINK')
 HTTP = 'https://'
-AWS_DEFAULT_ACL = None
\ No newline at end of file
+AWS_DEFAULT_ACL = None
+
+# Maximum size (in bytes) of an uploaded user avatar
+AVATAR_MAX_UPLOAD_SIZE = int(os.getenv('AVATAR_MAX_UPLOAD_SIZE', 2 * 1024 * 1024))
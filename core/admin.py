@@ -5,7 +5,18 @@ from django.utils.translation import ugettext_lazy as _
 from core.models import CoreUser, CoreGroup, CoreSites, EmailTemplate, Industry, LogicModule, Organization
 
 
-class LogicModuleAdmin(admin.ModelAdmin):
+class CoreGroupsFieldMixin:
+    """
+    Load the core groups choices with their organizations, they are part of the CoreGroup's string representation
+    """
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'core_groups':
+            kwargs['queryset'] = CoreGroup.objects.select_related('organization')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
+
+class LogicModuleAdmin(CoreGroupsFieldMixin, admin.ModelAdmin):
     list_display = ('name',)
     list_filter = ('name',)
 
@@ -24,11 +35,12 @@ class OrganizationAdmin(admin.ModelAdmin):
 
 class CoreGroupAdmin(admin.ModelAdmin):
     list_display = ('name', 'organization', 'is_global', 'is_org_level', 'is_default', 'permissions')
+    list_select_related = ('organization', )
     display = 'Core Group'
     search_fields = ('name', 'organization__name', )
 
 
-class CoreUserAdmin(UserAdmin):
+class CoreUserAdmin(CoreGroupsFieldMixin, UserAdmin):
     list_display = ('username', 'first_name', 'last_name', 'organization', 'is_active')
     display = 'Core User'
     list_filter = ('is_staff', 'organization')
@@ -41,6 +53,7 @@ class CoreUserAdmin(UserAdmin):
         (_('Important dates'), {'fields': ('last_login', 'date_joined', 'create_date', 'edit_date')}),
     )
     filter_horizontal = ('core_groups', 'user_permissions', )
+    readonly_fields = ('edit_date', )
 
     def get_fieldsets(self, request, obj=None):
 
@@ -23,7 +23,7 @@ def create_organization(core_user=None, *args, **kwargs):
         organization, created = Organization.objects.get_or_create(name=core_user.username)
 
     core_user.organization = organization
-    core_user.save()
+    core_user.save(update_fields=['organization', 'edit_date'])
 
     return {
         'is_new_org': created,
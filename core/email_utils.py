@@ -1,16 +1,37 @@
-from django.core.mail import EmailMultiAlternatives
+from typing import List
+
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template import loader
 from django.conf import settings
 
 
 def send_email(email_address: str, subject: str, context: dict, template_name: str,
                html_template_name: str = None, attachment=None) -> int:
+    return render_email(email_address, subject, context, template_name, html_template_name, attachment).send()
+
+
+def send_email_body(email_address: str, subject: str, text_content: str, html_content: str = None, attachment=None) -> int:
+    return build_email(email_address, subject, text_content, html_content, attachment).send()
+
+
+def send_emails(messages: List[EmailMultiAlternatives]) -> int:
+    """
+    Send all the messages through a single connection to the e-mail backend
+    """
+    if not messages:
+        return 0
+    return get_connection().send_messages(messages) or 0
+
+
+def render_email(email_address: str, subject: str, context: dict, template_name: str,
+                 html_template_name: str = None, attachment=None) -> EmailMultiAlternatives:
     text_content = loader.render_to_string(template_name, context, using=None)
     html_content = loader.render_to_string(html_template_name, context, using=None) if html_template_name else None
-    return send_email_body(email_address, subject, text_content, html_content, attachment)
+    return build_email(email_address, subject, text_content, html_content, attachment)
 
 
-def send_email_body(email_address: str, subject: str, text_content: str, html_content: str = None, attachment=None) -> int:
+def build_email(email_address: str, subject: str, text_content: str, html_content: str = None,
+                attachment=None) -> EmailMultiAlternatives:
     msg = EmailMultiAlternatives(
         from_email=settings.DEFAULT_FROM_EMAIL,
         subject=subject,
@@ -23,4 +44,4 @@ def send_email_body(email_address: str, subject: str, text_content: str, html_co
         msg.reply_to = [settings.DEFAULT_REPLYTO_EMAIL]
     if html_content:
         msg.attach_alternative(html_content, "text/html")
-    return msg.send()
+    return msg
@@ -1,5 +1,7 @@
 import logging
 import datetime
+import time
+from functools import lru_cache
 
 import jwt
 from django.conf import settings
@@ -10,6 +12,12 @@ from gateway.exceptions import PermissionDenied
 
 logger = logging.getLogger(__name__)
 
+JWT_ALGORITHM = 'HS256'
+JWT_ALGORITHMS = [JWT_ALGORITHM]
+
+INVITATION_TOKEN_CLAIMS = ('email', 'org_uuid')
+EVENT_INVITATION_TOKEN_CLAIMS = ('email', 'organization', 'room_uuid', 'event_uuid')
+
 
 def payload_enricher(request):
     if request.POST.get('username'):
@@ -21,7 +29,7 @@ def payload_enricher(request):
             logger.error('No matching CoreUser found.')
             raise PermissionDenied('No matching CoreUser found.')
         return {
-            'core_user_uuid': user['core_user_uuid'],
+            'core_user_uuid': str(user['core_user_uuid']),
             'organization_uuid': str(user['organization__organization_uuid']),
         }
     elif request.POST.get('refresh_token'):
@@ -29,7 +37,7 @@ def payload_enricher(request):
             refresh_token = RefreshToken.objects.get(token=request.POST.get('refresh_token'))
             user = refresh_token.user
             return {
-                'core_user_uuid': user.core_user_uuid,
+                'core_user_uuid': str(user.core_user_uuid),
                 'organization_uuid': str(user.organization.organization_uuid),
                 'username': user.username,
             }
@@ -39,22 +47,56 @@ def payload_enricher(request):
 
 
 def create_invitation_token(email_address: str, organization: Organization):
-    exp_hours = datetime.timedelta(hours=settings.INVITATION_EXPIRE_HOURS)
-    payload = {
-        'email': email_address,
-        'org_uuid': str(organization.organization_uuid) if organization else None,
-        'exp': datetime.datetime.utcnow() + exp_hours
-    }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256').decode('utf-8')
+    return create_invitation_tokens([email_address], organization)[0]
+
+
+def create_invitation_tokens(email_addresses, organization: Organization) -> list:
+    """
+    Create the invitation tokens for all the e-mail addresses, the claims shared by the tokens are built only once
+    """
+    exp = datetime.datetime.utcnow() + datetime.timedelta(hours=settings.INVITATION_EXPIRE_HOURS)
+    org_uuid = str(organization.organization_uuid) if organization else None
+    key = settings.SECRET_KEY.encode('utf-8')
+    return [
+        jwt.encode({'email': email_address, 'org_uuid': org_uuid, 'exp': exp},
+                   key, algorithm=JWT_ALGORITHM).decode('utf-8')
+        for email_address in email_addresses
+    ]
 
 
 def create_invitation_token_event(email_address: str, organization: str, room_uuid: int, event_uuid: int):
-    exp_hours = datetime.timedelta(hours=settings.INVITATION_EXPIRE_HOURS)
-    payload = {
-        'email': email_address,
-        'room_uuid': room_uuid,
-        'event_uuid': event_uuid,
-        'organization': organization,
-        'exp': datetime.datetime.utcnow() + exp_hours
-    }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256').decode('utf-8')
+    return create_invitation_tokens_event([(email_address, organization)], room_uuid, event_uuid)[0]
+
+
+def create_invitation_tokens_event(invitees, room_uuid: int, event_uuid: int) -> list:
+    """
+    Create the event invitation tokens for the (e-mail address, organization name) pairs of the invitees
+    """
+    exp = datetime.datetime.utcnow() + datetime.timedelta(hours=settings.INVITATION_EXPIRE_HOURS)
+    key = settings.SECRET_KEY.encode('utf-8')
+    return [
+        jwt.encode({'email': email_address, 'room_uuid': room_uuid, 'event_uuid': event_uuid,
+                    'organization': organization, 'exp': exp},
+                   key, algorithm=JWT_ALGORITHM).decode('utf-8')
+        for email_address, organization in invitees
+    ]
+
+
+def decode_invitation_token(token: str, required_claims=INVITATION_TOKEN_CLAIMS) -> dict:
+    """
+    Verify the signature, the expiration and the required claims of an invitation token and return its payload
+    """
+    payload = _verify_token(token, settings.SECRET_KEY)
+    for claim in required_claims:
+        if claim not in payload:
+            raise jwt.MissingRequiredClaimError(claim)
+    exp = payload.get('exp')
+    # the expiration is checked on every call as the verified payload is cached
+    if exp is not None and int(exp) < time.time():
+        raise jwt.ExpiredSignatureError('Signature has expired')
+    return dict(payload)
+
+
+@lru_cache(maxsize=4096)
+def _verify_token(token: str, key: str) -> dict:
+    return jwt.decode(token, key, algorithms=JWT_ALGORITHMS, options={'verify_exp': False, 'require_exp': True})
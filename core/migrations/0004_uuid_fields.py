@@ -0,0 +1,29 @@
+# Generated by Django 2.2.13 on 2026-10-14 10:40
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_coreuser_avatar'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='coregroup',
+            name='uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='CoreGroup UUID'),
+        ),
+        migrations.AlterField(
+            model_name='coreuser',
+            name='core_user_uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='CoreUser UUID'),
+        ),
+        migrations.AlterField(
+            model_name='logicmodule',
+            name='module_uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='Logic Module UUID'),
+        ),
+    ]
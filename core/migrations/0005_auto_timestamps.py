@@ -0,0 +1,74 @@
+# Generated by Django 2.2.13 on 2026-10-14 11:05
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_uuid_fields'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'UPDATE core_coregroup SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='coregroup',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunSQL(
+            'UPDATE core_coreuser SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='coreuser',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='industry',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE core_industry SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='industry',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='logicmodule',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE core_logicmodule SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='logicmodule',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE core_organization SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-14 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_auto_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['name'], name='core_organi_name_d0cc3b_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.13 on 2026-10-14 12:04
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_organization_name_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organization',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['oauth_domains'], name='core_organi_oauth_d_ec0794_gin'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-14 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_organization_oauth_domains_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='coregroup',
+            index=models.Index(fields=['name'], name='core_coregr_name_8fbe42_idx'),
+        ),
+    ]
@@ -2,7 +2,9 @@ import uuid
 
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.fields import ArrayField, JSONField
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
@@ -29,6 +31,13 @@ PERMISSIONS_VIEW_ONLY = 4  # 0100
 
 PERMISSIONS_NO_ACCESS = 0  # 0000
 
+# 4-bit binary representations of all the permissions, indexed by the permissions value
+DISPLAY_PERMISSIONS = tuple('{0:04b}'.format(permissions) for permissions in range(16))
+
+# kept short as the cache is per process unless a shared backend is configured in CACHES, so the entry dropped
+# on save/delete stays in the other workers, and QuerySet.update()/delete() don't drop it at all
+ORGANIZATION_SUMMARY_CACHE_TIMEOUT = 30  # seconds
+
 TEMPLATE_RESET_PASSWORD, TEMPLATE_INVITE = 1, 2
 TEMPLATE_TYPES = (
     (TEMPLATE_RESET_PASSWORD, 'Password resetting'),
@@ -62,19 +71,13 @@ class CoreSites(models.Model):
 class Industry(models.Model):
     name = models.CharField("Industry Name", max_length=255, blank=True, default="Tech")
     description = models.TextField("Description/Notes", max_length=765, null=True, blank=True)
-    create_date = models.DateTimeField(null=True, blank=True)
-    edit_date = models.DateTimeField(null=True, blank=True)
+    create_date = models.DateTimeField(default=timezone.now)
+    edit_date = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ('name',)
         verbose_name_plural = "Industries"
 
-    def save(self, *args, **kwargs):
-        if self.create_date is None:
-            self.create_date = timezone.now()
-        self.edit_date = timezone.now()
-        super(Industry, self).save()
-
     def __str__(self):
         return self.name
 
@@ -89,8 +92,8 @@ class Organization(models.Model):
     description = models.TextField("Description/Notes", max_length=765, null=True, blank=True, help_text="Description of organization")
     organization_url = models.CharField(blank=True, null=True, max_length=255, help_text="Link to organizations external web site")
     industries = models.ManyToManyField(Industry, blank=True, related_name='organizations', help_text="Type of Industry the organization belongs to if any")
-    create_date = models.DateTimeField(null=True, blank=True)
-    edit_date = models.DateTimeField(null=True, blank=True)
+    create_date = models.DateTimeField(default=timezone.now)
+    edit_date = models.DateTimeField(auto_now=True)
     oauth_domains = ArrayField(models.CharField("OAuth Domains", max_length=255, null=True, blank=True), null=True, blank=True)
     date_format = models.CharField("Date Format", max_length=50, blank=True, default="DD.MM.YYYY")
     phone = models.CharField(max_length=20, blank=True, null=True)
@@ -98,34 +101,60 @@ class Organization(models.Model):
     class Meta:
         ordering = ('name',)
         verbose_name_plural = "Organizations"
+        indexes = [
+            models.Index(fields=['name']),
+            GinIndex(fields=['oauth_domains']),
+        ]
 
     def __str__(self):
         return self.name
 
     def save(self, *args, **kwargs):
         is_new = self._state.adding
-        if self.create_date is None:
-            self.create_date = timezone.now()
-        self.edit_date = timezone.now()
-        super(Organization, self).save()
+        super(Organization, self).save(*args, **kwargs)
+        cache.delete(self.summary_cache_key(self.organization_uuid))
         if is_new:
             self._create_initial_groups()
 
+    def delete(self, *args, **kwargs):
+        cache.delete(self.summary_cache_key(self.organization_uuid))
+        return super(Organization, self).delete(*args, **kwargs)
+
+    @staticmethod
+    def summary_cache_key(organization_uuid) -> str:
+        return f'organization_summary:{organization_uuid}'
+
+    @classmethod
+    def get_summary(cls, organization_uuid):
+        """
+        Return the UUID and the name of the organization, cached as they are read on every invitation check.
+        The summary may be stale for up to ORGANIZATION_SUMMARY_CACHE_TIMEOUT seconds after the organization
+        is renamed or deleted.
+        """
+        key = cls.summary_cache_key(organization_uuid)
+        summary = cache.get(key)
+        if summary is None:
+            summary = cls.objects.values('organization_uuid', 'name').filter(organization_uuid=organization_uuid).first()
+            if summary is not None:
+                cache.set(key, summary, ORGANIZATION_SUMMARY_CACHE_TIMEOUT)
+        return summary
+
     def _create_initial_groups(self):
-        CoreGroup.objects.create(
-            organization=self,
-            is_org_level=True,
-            name='Admins',
-            permissions=PERMISSIONS_ORG_ADMIN
-        )
-
-        CoreGroup.objects.create(
-            organization=self,
-            is_org_level=True,
-            is_default=True,
-            name='Users',
-            permissions=PERMISSIONS_VIEW_ONLY
-        )
+        CoreGroup.objects.bulk_create([
+            CoreGroup(
+                organization=self,
+                is_org_level=True,
+                name='Admins',
+                permissions=PERMISSIONS_ORG_ADMIN
+            ),
+            CoreGroup(
+                organization=self,
+                is_org_level=True,
+                is_default=True,
+                name='Users',
+                permissions=PERMISSIONS_VIEW_ONLY
+            ),
+        ])
 
 
 class CoreGroup(models.Model):
@@ -135,7 +164,7 @@ class CoreGroup(models.Model):
     Permissions field is the decimal integer from 0 to 15 converted from 4-bit binary, each bit indicates permissions
     for CRUD. For example: 12 -> 1100 -> CR__ (allowed to Create and Read).
     """
-    uuid = models.CharField('CoreGroup UUID', max_length=255, default=uuid.uuid4, unique=True)
+    uuid = models.UUIDField('CoreGroup UUID', default=uuid.uuid4, editable=False, unique=True)
     name = models.CharField('Name of the role', max_length=80)
     organization = models.ForeignKey(Organization, blank=True, null=True, on_delete=models.CASCADE, help_text='Related Org to associate with')
     is_global = models.BooleanField('Is global group', default=False)
@@ -143,21 +172,20 @@ class CoreGroup(models.Model):
     is_default = models.BooleanField('Is organization default group', default=False)
     permissions = models.PositiveSmallIntegerField('Permissions', default=PERMISSIONS_VIEW_ONLY, help_text='Decimal integer from 0 to 15 converted from 4-bit binary, each bit indicates permissions for CRUD')
     create_date = models.DateTimeField(default=timezone.now)
-    edit_date = models.DateTimeField(null=True, blank=True)
+    edit_date = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ('name',)
+        indexes = [
+            models.Index(fields=['name']),
+        ]
 
     def __str__(self):
         return f'{self.name} <{self.organization}>'
 
-    def save(self, *args, **kwargs):
-        self.edit_date = timezone.now()
-        super(CoreGroup, self).save(*args, **kwargs)
-
     @property
     def display_permissions(self) -> str:
-        return '{0:04b}'.format(self.permissions if self.permissions < 16 else 15)
+        return DISPLAY_PERMISSIONS[self.permissions if self.permissions < 16 else 15]
 
 
 class CoreUser(AbstractUser):
@@ -170,14 +198,14 @@ class CoreUser(AbstractUser):
         ('ms', 'Ms.'),
     )
 
-    core_user_uuid = models.CharField(max_length=255, verbose_name='CoreUser UUID', default=uuid.uuid4, unique=True)
+    core_user_uuid = models.UUIDField(verbose_name='CoreUser UUID', default=uuid.uuid4, editable=False, unique=True)
     title = models.CharField(blank=True, null=True, max_length=3, choices=TITLE_CHOICES)
     contact_info = models.CharField(blank=True, null=True, max_length=255)
     organization = models.ForeignKey(Organization, blank=True, null=True, on_delete=models.CASCADE, help_text='Related Org to associate with')
     core_groups = models.ManyToManyField(CoreGroup, verbose_name='User groups', blank=True, related_name='user_set', related_query_name='user')
     privacy_disclaimer_accepted = models.BooleanField(default=False)
     create_date = models.DateTimeField(default=timezone.now)
-    edit_date = models.DateTimeField(null=True, blank=True)
+    edit_date = models.DateTimeField(auto_now=True)
     avatar = models.ImageField(blank=True,null=True,verbose_name='User avatar')
 
     class Meta:
@@ -188,10 +216,7 @@ class CoreUser(AbstractUser):
 
     def save(self, *args, **kwargs):
         is_new = self.pk is None
-        if self.create_date is None:
-            self.create_date = timezone.now()
-        self.edit_date = timezone.now()
-        super(CoreUser, self).save()
+        super(CoreUser, self).save(*args, **kwargs)
         if is_new:
             # Add default groups
             self.core_groups.add(*CoreGroup.objects.filter(organization=self.organization, is_default=True))
@@ -237,7 +262,7 @@ class EmailTemplate(models.Model):
 
 
 class LogicModule(models.Model):
-    module_uuid = models.CharField(max_length=255, verbose_name='Logic Module UUID', default=uuid.uuid4, unique=True)
+    module_uuid = models.UUIDField(verbose_name='Logic Module UUID', default=uuid.uuid4, editable=False, unique=True)
     name = models.CharField("Logic Module Name", max_length=255, blank=True)
     description = models.TextField("Description/Notes", max_length=765, null=True, blank=True)
     endpoint = models.CharField(blank=True, null=True, max_length=255)
@@ -245,19 +270,13 @@ class LogicModule(models.Model):
     docs_endpoint = models.CharField(blank=True, null=True, max_length=255)
     api_specification = JSONField(blank=True, null=True)
     core_groups = models.ManyToManyField(CoreGroup, verbose_name='Logic Module groups', blank=True, related_name='logic_module_set', related_query_name='logic_module')
-    create_date = models.DateTimeField(null=True, blank=True)
-    edit_date = models.DateTimeField(null=True, blank=True)
+    create_date = models.DateTimeField(default=timezone.now)
+    edit_date = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ('name',)
         verbose_name_plural = "Logic Modules"
         unique_together = (('endpoint', 'endpoint_name'),)
 
-    def save(self, *args, **kwargs):
-        if self.create_date is None:
-            self.create_date = timezone.now()
-        self.edit_date = timezone.now()
-        super(LogicModule, self).save()
-
     def __str__(self):
         return str(self.name)
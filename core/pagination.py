@@ -0,0 +1,9 @@
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class OptionalLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Paginate only when the `limit` query parameter is given, bounded by `max_limit`
+    """
+    default_limit = None
+    max_limit = 500
@@ -1,6 +1,8 @@
 import jwt
-import secrets
+import os
 
+from base64 import urlsafe_b64encode
+from functools import lru_cache
 from urllib.parse import urljoin
 
 from django.contrib.auth import password_validation
@@ -8,18 +10,30 @@ from django.contrib.auth.tokens import default_token_generator
 from django.conf import settings
 from django.utils.encoding import force_bytes, force_text
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
-from django.template import Template, Context
+from django.template import engines
 from rest_framework import serializers
 from buildly.settings.base import AWS_STORAGE_BUCKET_NAME, AWS_URL_LINK, HTTP
 from buildly.storage_backends import MediaStorage
 
 from oauth2_provider.models import AccessToken, Application, RefreshToken
 
-from core.email_utils import send_email, send_email_body
+from core.email_utils import build_email, render_email, send_emails
+from core.jwt_utils import decode_invitation_token
 
 from core.models import CoreUser, CoreGroup, EmailTemplate, LogicModule, Organization, PERMISSIONS_ORG_ADMIN, \
     TEMPLATE_RESET_PASSWORD
 
+AVATAR_URL_PREFIX = f'{HTTP}{AWS_STORAGE_BUCKET_NAME}{AWS_URL_LINK}/{MediaStorage.location}/'
+DEFAULT_AVATAR_URL = f'{AVATAR_URL_PREFIX}default_pic.png'
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template_source: str):
+    """
+    Compile e-mail template once and reuse it for all the following renderings
+    """
+    return engines['django'].from_string(template_source)
+
 
 class LogicModuleSerializer(serializers.ModelSerializer):
     id = serializers.ReadOnlyField()
@@ -36,15 +50,16 @@ class PermissionsField(serializers.DictField):
     For example:
     9 -> '1001' (binary representation) -> `{'create': True, 'read': False, 'update': False, 'delete': True}`
     """
-    _keys = ('create', 'read', 'update', 'delete')
+    _masks = (('create', 8), ('read', 4), ('update', 2), ('delete', 1))
+    _keys = tuple(key for key, _ in _masks)
 
     def __init__(self, *args, **kwargs):
         kwargs['child'] = serializers.BooleanField()
         super().__init__(*args, **kwargs)
 
     def to_representation(self, value):
-        permissions = list('{0:04b}'.format(value if value < 16 else 15))
-        return dict(zip(self._keys, map(bool, map(int, permissions))))
+        value = value if value < 16 else 15
+        return {key: bool(value & mask) for key, mask in self._masks}
 
     def to_internal_value(self, data):
         data = super().to_internal_value(data)
@@ -52,14 +67,41 @@ class PermissionsField(serializers.DictField):
         if not set(keys) == set(self._keys):
             raise serializers.ValidationError("Permissions field: incorrect keys format")
 
-        permissions = ''.join([str(int(data[key])) for key in self._keys])
-        return int(permissions, 2)
+        return sum(mask for key, mask in self._masks if data[key])
 
 
 class UUIDPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
 
     def to_representation(self, value):
-        return str(super().to_representation(value))
+        return str(value.pk)
+
+
+class AvatarField(serializers.ImageField):
+    """
+    Image field for user avatars.
+    The upload size is checked before the image is opened with Pillow, so oversized files don't block the worker.
+    The public URL of the avatar is built from the media prefix without calling the storage backend
+    """
+    default_error_messages = {
+        'max_upload_size': 'Ensure the image is not bigger than {max_size} bytes.',
+    }
+
+    def to_representation(self, value):
+        return f'{AVATAR_URL_PREFIX}{value}' if value else DEFAULT_AVATAR_URL
+
+    def to_internal_value(self, data):
+        size = getattr(data, 'size', None)
+        if size is not None and size > settings.AVATAR_MAX_UPLOAD_SIZE:
+            self.fail('max_upload_size', max_size=settings.AVATAR_MAX_UPLOAD_SIZE)
+        return super().to_internal_value(data)
+
+
+class OrganizationSerializer(serializers.ModelSerializer):
+    id = serializers.UUIDField(source='organization_uuid', read_only=True)
+
+    class Meta:
+        model = Organization
+        fields = '__all__'
 
 
 class CoreGroupSerializer(serializers.ModelSerializer):
@@ -68,10 +110,12 @@ class CoreGroupSerializer(serializers.ModelSerializer):
     organization = UUIDPrimaryKeyRelatedField(required=False,
                                               queryset=Organization.objects.all(),
                                               help_text="Related Org to associate with")
+    workflowlevel1s = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    workflowlevel2s = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
 
     class Meta:
         model = CoreGroup
-        read_only_fields = ('uuid', 'workflowlevel1s', 'workflowlevel2s')
+        read_only_fields = ('uuid',)
         fields = ('id', 'uuid', 'name', 'is_global', 'is_org_level', 'permissions', 'organization', 'workflowlevel1s',
                   'workflowlevel2s')
 
@@ -81,17 +125,20 @@ class CoreUserSerializer(serializers.ModelSerializer):
     Default CoreUser serializer
     """
     is_active = serializers.BooleanField(required=False)
+    organization = OrganizationSerializer(read_only=True)
     core_groups = CoreGroupSerializer(read_only=True, many=True)
     invitation_token = serializers.CharField(required=False)
-    avatar = serializers.ImageField(required=False)
+    avatar = AvatarField(required=False)
 
     def validate_invitation_token(self, value):
         try:
-            decoded = jwt.decode(value, settings.SECRET_KEY, algorithms='HS256')
-            coreuser_exists = CoreUser.objects.filter(email=decoded['email']).exists()
-            if coreuser_exists or decoded['email'] != self.initial_data['email']:
+            decoded = decode_invitation_token(value)
+            # compare the e-mail first to not hit the database for mismatching tokens
+            if decoded['email'] != self.initial_data['email']:
+                raise serializers.ValidationError('Token is not valid.')
+            if CoreUser.objects.filter(email=decoded['email']).exists():
                 raise serializers.ValidationError('Token is not valid.')
-        except jwt.DecodeError:
+        except (jwt.DecodeError, jwt.MissingRequiredClaimError):
             raise serializers.ValidationError('Token is not valid.')
         except jwt.ExpiredSignatureError:
             raise serializers.ValidationError('Token is expired.')
@@ -103,18 +150,18 @@ class CoreUserSerializer(serializers.ModelSerializer):
                   'title', 'contact_info', 'avatar', 'privacy_disclaimer_accepted', 'organization', 'core_groups',
                   'invitation_token',)
         read_only_fields = ('core_user_uuid', 'organization',)
-        depth = 1
+        # related objects rendered by this serializer, see `setup_eager_loading`
+        select_related = ('organization',)
+        prefetch_related = ('organization__industries', 'core_groups__workflowlevel1s', 'core_groups__workflowlevel2s')
 
-    def to_representation(self, instance):
-        response = super(CoreUserSerializer, self).to_representation(instance)
-        if instance.avatar:
-            response['avatar'] = HTTP+AWS_STORAGE_BUCKET_NAME+AWS_URL_LINK + \
-                '/'+MediaStorage.location+'/'+str(instance.avatar)
-        else:
-            # response['avatar'] = None
-            response['avatar'] = HTTP+AWS_STORAGE_BUCKET_NAME+AWS_URL_LINK + \
-                '/'+MediaStorage.location+'/default_pic.png'
-        return response
+    @classmethod
+    def setup_eager_loading(cls, queryset, prefix: str = ''):
+        """
+        Eager load the related objects used in the representation to avoid N+1 queries on lists.
+        `prefix` allows to apply the same lookups to a queryset of a model related to CoreUser (e.g. 'user__')
+        """
+        return queryset.select_related(*[prefix + lookup for lookup in cls.Meta.select_related])\
+            .prefetch_related(*[prefix + lookup for lookup in cls.Meta.prefetch_related])
 
 
 class CoreUserWritableSerializer(CoreUserSerializer):
@@ -122,6 +169,7 @@ class CoreUserWritableSerializer(CoreUserSerializer):
     Override default CoreUser serializer for writable actions (create, update, partial_update)
     """
     password = serializers.CharField(write_only=True)
+    organization = serializers.PrimaryKeyRelatedField(read_only=True)
     organization_name = serializers.CharField(source='organization.name')
     core_groups = serializers.PrimaryKeyRelatedField(many=True, queryset=CoreGroup.objects.all(), required=False)
 
@@ -141,24 +189,27 @@ class CoreUserWritableSerializer(CoreUserSerializer):
 
         # force the 'is_active flag = true' for all users
         validated_data['is_active'] = True
-        coreuser = CoreUser.objects.create(
+        password = validated_data.pop('password')
+        coreuser = CoreUser(
             organization=organization,
             **validated_data
         )
-        # set user password
-        coreuser.set_password(validated_data['password'])
+        # set user password before the user is saved, so it's inserted hashed in one query
+        coreuser.set_password(password)
         coreuser.save()
 
+        # add requested groups to the user
+        groups_to_add = list(core_groups)
+
         # add org admin role to the user if org is new
         if is_new_org:
-            group_org_admin = CoreGroup.objects.get(organization=organization,
-                                                    is_org_level=True,
-                                                    permissions=PERMISSIONS_ORG_ADMIN)
-            coreuser.core_groups.add(group_org_admin)
+            group_org_admin = CoreGroup.objects.only('pk').get(organization=organization,
+                                                               is_org_level=True,
+                                                               permissions=PERMISSIONS_ORG_ADMIN)
+            groups_to_add.append(group_org_admin)
 
-        # add requested groups to the user
-        for group in core_groups:
-            coreuser.core_groups.add(group)
+        if groups_to_add:
+            coreuser.core_groups.add(*groups_to_add)
 
         return coreuser
 
@@ -166,7 +217,7 @@ class CoreUserWritableSerializer(CoreUserSerializer):
 
 
 class CoreUserProfileSerializer(serializers.ModelSerializer):
-    avatar = serializers.ImageField(max_length=None, allow_empty_file=True, allow_null=True, required=False)
+    avatar = AvatarField(max_length=None, allow_empty_file=True, allow_null=True, required=False)
     first_name = serializers.CharField(required=False)
     last_name = serializers.CharField(required=False)
     password = serializers.CharField(required=False)
@@ -175,17 +226,6 @@ class CoreUserProfileSerializer(serializers.ModelSerializer):
         model = CoreUser
         fields = ('first_name', 'last_name', 'password', 'avatar',)
 
-    def to_representation(self, instance):
-        response = super(CoreUserProfileSerializer, self).to_representation(instance)
-        if instance.avatar:
-            response['avatar'] = HTTP+AWS_STORAGE_BUCKET_NAME+AWS_URL_LINK + \
-                '/'+MediaStorage.location+'/'+str(instance.avatar)
-        else:
-            # response['avatar'] = None
-            response['avatar'] = HTTP+AWS_STORAGE_BUCKET_NAME+AWS_URL_LINK + \
-                '/'+MediaStorage.location+'/default_pic.png'
-        return response
-
     def update(self, instance, validated_data):
         """
         Update user avatar.
@@ -193,14 +233,12 @@ class CoreUserProfileSerializer(serializers.ModelSerializer):
         password = validated_data.pop('password', None)
         instance.first_name = validated_data.pop('first_name', instance.first_name)
         instance.last_name = validated_data.pop('last_name', instance.last_name)
-        instance.avatar = validated_data.get("avatar", instance.avatar)
+        instance.avatar = validated_data.get("avatar", instance.avatar) or None
+        update_fields = ['first_name', 'last_name', 'avatar', 'edit_date']
         if password is not None:
             instance.set_password(password)
-        if instance.avatar:
-            instance.save()
-        else:
-            instance.avatar = None
-            instance.save()
+            update_fields.append('password')
+        instance.save(update_fields=update_fields)
 
         return instance
 
@@ -235,8 +273,22 @@ class CoreUserResetPasswordSerializer(serializers.Serializer):
 
         email = self.validated_data["email"]
 
-        count = 0
-        for user in CoreUser.objects.filter(email=email, is_active=True):
+        # e-mail templates are fetched only once per lookup, users may share the organization
+        templates = {}
+
+        def get_template(**lookup):
+            key = tuple(lookup.items())
+            if key not in templates:
+                templates[key] = EmailTemplate.objects.filter(type=TEMPLATE_RESET_PASSWORD, **lookup).first()
+            return templates[key]
+
+        # load only the columns used by the token generator and the default templates
+        users = CoreUser.objects.filter(email=email, is_active=True)\
+            .only('pk', 'password', 'last_login', 'username', 'email', 'first_name', 'last_name', 'organization')\
+            .select_related('organization')
+
+        messages = []
+        for user in users:
             uid = urlsafe_base64_encode(force_bytes(user.pk))
             token = default_token_generator.make_token(user)
             context = {
@@ -245,24 +297,22 @@ class CoreUserResetPasswordSerializer(serializers.Serializer):
             }
 
             # get specific subj and templates for user's organization
-            tpl = EmailTemplate.objects.filter(organization=user.organization, type=TEMPLATE_RESET_PASSWORD).first()
-            if not tpl:
-                tpl = EmailTemplate.objects.filter(organization__name=settings.DEFAULT_ORG,
-                                                   type=TEMPLATE_RESET_PASSWORD).first()
+            tpl = get_template(organization_id=user.organization_id) or \
+                get_template(organization__name=settings.DEFAULT_ORG)
             if tpl and tpl.template:
-                context = Context(context)
-                text_content = Template(tpl.template).render(context)
-                html_content = Template(tpl.template_html).render(context) if tpl.template_html else None
-                count += send_email_body(email, tpl.subject, text_content, html_content)
+                text_content = _compile_template(tpl.template).render(context)
+                html_content = _compile_template(tpl.template_html).render(context) if tpl.template_html else None
+                messages.append(build_email(email, tpl.subject, text_content, html_content))
                 continue
 
             # default subject and templates
             subject = 'Reset your password'
             template_name = 'email/coreuser/password_reset.txt'
             html_template_name = 'email/coreuser/password_reset.html'
-            count += send_email(email, subject, context, template_name, html_template_name)
+            messages.append(render_email(email, subject, context, template_name, html_template_name))
 
-        return count
+        # send all the e-mails through one connection to the e-mail backend
+        return send_emails(messages)
 
 
 class CoreUserResetPasswordCheckSerializer(serializers.Serializer):
@@ -306,34 +356,49 @@ class CoreUserResetPasswordConfirmSerializer(CoreUserResetPasswordCheckSerialize
 
     def save(self):
         self.user.set_password(self.validated_data["new_password1"])
-        self.user.save()
+        self.user.save(update_fields=['password', 'edit_date'])
         return self.user
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
-    id = serializers.UUIDField(source='organization_uuid', read_only=True)
+class NestedCoreUserSerializer(CoreUserSerializer):
+    """
+    CoreUser serializer for nesting into other serializers.
+    Each user is serialized only once per root serializer, even if it's referenced by several objects
+    (e.g. a refresh token and its access token)
+    """
 
-    class Meta:
-        model = Organization
-        fields = '__all__'
+    def to_representation(self, instance):
+        serialized_users = self.context.setdefault('serialized_users', {})
+        if instance.pk not in serialized_users:
+            serialized_users[instance.pk] = super().to_representation(instance)
+        return serialized_users[instance.pk]
 
 
 class AccessTokenSerializer(serializers.ModelSerializer):
-    user = CoreUserSerializer()
+    user = NestedCoreUserSerializer()
 
     class Meta:
         model = AccessToken
         fields = ('id', 'user', 'token', 'expires')
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return CoreUserSerializer.setup_eager_loading(queryset, prefix='user__')
+
 
 class RefreshTokenSerializer(serializers.ModelSerializer):
     access_token = AccessTokenSerializer()
-    user = CoreUserSerializer()
+    user = NestedCoreUserSerializer()
 
     class Meta:
         model = RefreshToken
         fields = ('id', 'user', 'token', 'access_token', 'revoked')
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        queryset = CoreUserSerializer.setup_eager_loading(queryset, prefix='user__')
+        return CoreUserSerializer.setup_eager_loading(queryset, prefix='access_token__user__')
+
 
 class ApplicationSerializer(serializers.ModelSerializer):
     client_id = serializers.CharField(read_only=True, max_length=100)
@@ -345,6 +410,8 @@ class ApplicationSerializer(serializers.ModelSerializer):
                   'redirect_uris')
 
     def create(self, validated_data):
-        validated_data['client_id'] = secrets.token_urlsafe(75)
-        validated_data['client_secret'] = secrets.token_urlsafe(190)
+        # read random bytes for both credentials at once (same encoding as `secrets.token_urlsafe`)
+        random_bytes = os.urandom(75 + 190)
+        validated_data['client_id'] = urlsafe_b64encode(random_bytes[:75]).rstrip(b'=').decode('ascii')
+        validated_data['client_secret'] = urlsafe_b64encode(random_bytes[75:]).rstrip(b'=').decode('ascii')
         return super(ApplicationSerializer, self).create(validated_data)
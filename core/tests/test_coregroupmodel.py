@@ -1,6 +1,9 @@
 import pytest
+
 import factories
 
+from core.models import PERMISSIONS_ORG_ADMIN
+
 
 @pytest.mark.django_db()
 def test_coregroup_display_permissions():
@@ -23,3 +26,13 @@ def test_coregroups_autocreation():
 def test_default_coregroup():
     user = factories.CoreUser.create()
     assert user.core_groups.count() == 1
+
+
+@pytest.mark.django_db()
+def test_coregroups_autocreation_fields():
+    org = factories.Organization.create()
+    admins, users = org.coregroup_set.order_by('name')
+    assert (admins.name, admins.permissions, admins.is_default) == ('Admins', PERMISSIONS_ORG_ADMIN, False)
+    assert (users.name, users.is_default) == ('Users', True)
+    assert admins.uuid != users.uuid
+    assert admins.create_date and admins.edit_date
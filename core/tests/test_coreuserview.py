@@ -1,6 +1,7 @@
 from datetime import date, timedelta
 from urllib.parse import urljoin
 from unittest import mock
+import uuid
 
 import pytest
 from django.core import mail
@@ -214,6 +215,10 @@ class TestCoreUserUpdate:
         coreuser = CoreUser.objects.get(pk=pk)
         assert set(coreuser.core_groups.all()) == set(new_groups)
 
+    def test_coreuser_update_queryset_not_eager_loaded(self):
+        assert not CoreUserViewSet(action='partial_update').get_queryset()._prefetch_related_lookups
+        assert CoreUserViewSet(action='retrieve').get_queryset()._prefetch_related_lookups
+
 
 @pytest.mark.django_db()
 class TestCoreUserInvite:
@@ -226,6 +231,14 @@ class TestCoreUserInvite:
         assert response.status_code == 200
         assert len(response.data['invitations']) == 1
 
+    def test_invitation_duplicated_emails(self, request_factory, org_admin):
+        data = {'emails': [TEST_USER_DATA['email'], TEST_USER_DATA['email'], org_admin.email]}
+        request = request_factory.post(reverse('coreuser-invite'), data)
+        request.user = org_admin
+        response = CoreUserViewSet.as_view({'post': 'invite'})(request)
+        assert response.status_code == 200
+        assert len(response.data['invitations']) == 1
+
     def test_invitation_check(self, request_factory, org):
         token = create_invitation_token(TEST_USER_DATA['email'], org)
         request = request_factory.get(reverse('coreuser-invite-check'), {'token': token})
@@ -234,6 +247,56 @@ class TestCoreUserInvite:
         assert response.data['email'] == TEST_USER_DATA['email']
         assert response.data['organization']['organization_uuid'] == org.organization_uuid
 
+    def test_invitation_check_organization_renamed(self, request_factory, org):
+        token = create_invitation_token(TEST_USER_DATA['email'], org)
+        request = request_factory.get(reverse('coreuser-invite-check'), {'token': token})
+        CoreUserViewSet.as_view({'get': 'invite_check'})(request)
+
+        # saving the organization drops its cached summary
+        org.name = 'Renamed Org'
+        org.save()
+        response = CoreUserViewSet.as_view({'get': 'invite_check'})(request)
+        assert response.status_code == 200
+        assert response.data['organization']['name'] == 'Renamed Org'
+
+    def test_invite_event(self, request_factory, org_member):
+        data = {
+            'room_uuid': str(uuid.uuid4()),
+            'event_uuid': str(uuid.uuid4()),
+            'emails': [org_member.email, TEST_USER_DATA['email']],
+            'event_name': 'Event',
+            'organization_name': 'Event Org',
+            'start_date_time': '2020-01-01T10:00:00Z',
+            'end_date_time': '2020-01-01T12:00:00Z',
+        }
+        request = request_factory.post(reverse('coreuser-invite-event'), data, format='json')
+        request.user = org_member
+        response = CoreUserViewSet.as_view({'post': 'invite_event'})(request)
+        assert response.status_code == 200
+        assert len(response.data['event_link']) == 2
+        assert len(mail.outbox) == 2
+
+    def test_invite_event_duplicated_user_email(self, request_factory, org_member):
+        email = 'shared@example.com'
+        factories.CoreUser.create(username='first', first_name='A', email=email,
+                                  organization=factories.Organization(name='First Org'))
+        factories.CoreUser.create(username='second', first_name='B', email=email,
+                                  organization=factories.Organization(name='Second Org'))
+        data = {
+            'room_uuid': str(uuid.uuid4()),
+            'event_uuid': str(uuid.uuid4()),
+            'emails': [email],
+            'event_name': 'Event',
+            'organization_name': 'Event Org',
+            'start_date_time': '2020-01-01T10:00:00Z',
+            'end_date_time': '2020-01-01T12:00:00Z',
+        }
+        request = request_factory.post(reverse('coreuser-invite-event'), data, format='json')
+        request.user = org_member
+        response = CoreUserViewSet.as_view({'post': 'invite_event'})(request)
+        assert response.status_code == 200
+        assert mail.outbox[0].subject == 'Welcome to event Event at First Org'
+
     def test_prevent_token_reuse(self, request_factory, org):
         token = create_invitation_token(TEST_USER_DATA['email'], org)
         registered_user = factories.CoreUser.create(is_active=False, email=TEST_USER_DATA['email'], username='user_org')
@@ -419,6 +482,25 @@ class TestCoreUserRead(object):
         assert len(data) == 2
         assert set(data[0].keys()) == self.keys
 
+    def test_coreuser_list_paginated(self, request_factory, org_member):
+        factories.CoreUser.create(organization=org_member.organization, username='another_user')
+        request = request_factory.get(reverse('coreuser-list'), {'limit': 1})
+        request.user = org_member
+        response = CoreUserViewSet.as_view({'get': 'list'})(request)
+        assert response.status_code == 200
+        assert response.data['count'] == 2
+        assert len(response.data['results']) == 1
+
+    def test_coreuser_list_limit_bounded(self, request_factory, org_member):
+        factories.CoreUser.create(organization=org_member.organization, username='another_user')
+        request = request_factory.get(reverse('coreuser-list'), {'limit': 1000000})
+        request.user = org_member
+        with mock.patch('core.pagination.OptionalLimitOffsetPagination.max_limit', 1):
+            response = CoreUserViewSet.as_view({'get': 'list'})(request)
+        assert response.status_code == 200
+        assert response.data['count'] == 2
+        assert len(response.data['results']) == 1
+
     def test_coreuser_retrieve(self, request_factory, org_member):
         core_user = factories.CoreUser.create(organization=org_member.organization, username='another_user')
 
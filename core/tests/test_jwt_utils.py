@@ -1,13 +1,18 @@
 import datetime
+import time
+from unittest import mock
 
+from django.conf import settings
 from django.test import TestCase
 from django.test.client import RequestFactory
 from django.utils import timezone
+import jwt
 
 import factories
 from oauth2_provider.models import get_application_model, get_access_token_model, get_refresh_token_model
 
-from core.jwt_utils import payload_enricher
+from core.jwt_utils import (create_invitation_token, create_invitation_tokens_event, decode_invitation_token,
+                            payload_enricher, EVENT_INVITATION_TOKEN_CLAIMS)
 from core.models import ROLE_ORGANIZATION_ADMIN
 
 
@@ -91,3 +96,33 @@ class JWTUtilsTest(TestCase):
             'username': self.core_user.username,
         }
         self.assertEqual(payload, expected_payload)
+
+
+class InvitationTokenTest(TestCase):
+
+    def test_decode_invitation_token(self):
+        organization = factories.Organization()
+        token = create_invitation_token('test@example.com', organization)
+        decoded = decode_invitation_token(token)
+        self.assertEqual(decoded['email'], 'test@example.com')
+        self.assertEqual(decoded['org_uuid'], str(organization.organization_uuid))
+
+    def test_decode_invitation_token_expired_after_cached(self):
+        token = create_invitation_token('test@example.com', None)
+        decode_invitation_token(token)
+        expired = time.time() + (settings.INVITATION_EXPIRE_HOURS + 1) * 3600
+        with mock.patch('core.jwt_utils.time.time', return_value=expired):
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                decode_invitation_token(token)
+
+    def test_decode_invitation_token_missing_claim(self):
+        token = create_invitation_token('test@example.com', None)
+        with self.assertRaises(jwt.MissingRequiredClaimError):
+            decode_invitation_token(token, EVENT_INVITATION_TOKEN_CLAIMS)
+
+    def test_create_invitation_tokens_event(self):
+        invitees = [('first@example.com', 'First Org'), ('second@example.com', 'Second Org')]
+        tokens = create_invitation_tokens_event(invitees, 1, 2)
+        decoded = [decode_invitation_token(token, EVENT_INVITATION_TOKEN_CLAIMS) for token in tokens]
+        self.assertEqual([(item['email'], item['organization']) for item in decoded], invitees)
+        self.assertTrue(all(item['room_uuid'] == 1 and item['event_uuid'] == 2 for item in decoded))
@@ -0,0 +1,20 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import factories
+
+
+@pytest.mark.django_db()
+def test_organization_save_update_fields():
+    org = factories.Organization.create(name='Org', description='Description')
+    org.name = 'Renamed Org'
+    org.description = 'Changed description'
+    with CaptureQueriesContext(connection) as context:
+        org.save(update_fields=['edit_date'])
+    updates = [query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+    assert len(updates) == 1
+    assert '"edit_date"' in updates[0] and '"name"' not in updates[0]
+
+    org.refresh_from_db()
+    assert (org.name, org.description) == ('Org', 'Description')
@@ -1,6 +1,10 @@
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 
-from core.serializers import OrganizationSerializer, CoreGroupSerializer, CoreUserSerializer
+import factories
+from core.models import CoreUser
+from core.serializers import (OrganizationSerializer, CoreGroupSerializer, CoreUserSerializer,
+                              CoreUserProfileSerializer, RefreshTokenSerializer)
 from core.tests.fixtures import core_group, org, org_member
 
 
@@ -63,3 +67,35 @@ def test_core_user_serializer(request_factory, org_member):
             ]
     assert set(data.keys()) == set(keys)
     assert isinstance(data['organization'], dict)
+
+
+@pytest.mark.django_db()
+def test_core_user_serializer_eager_loading(request_factory, django_assert_max_num_queries, org_member):
+    factories.CoreUser.create(organization=org_member.organization, username='another_user')
+    factories.CoreUser.create(organization=factories.Organization(name='another org'), username='yet_another_user')
+    request = request_factory.get('')
+    queryset = CoreUserSerializer.setup_eager_loading(CoreUser.objects.all())
+    # users with organizations, industries, core groups and their workflowlevel1s and workflowlevel2s
+    with django_assert_max_num_queries(5):
+        data = CoreUserSerializer(queryset, many=True, context={'request': request}).data
+    assert len(data) == 3
+
+
+@pytest.mark.django_db()
+def test_refresh_token_serializer_shared_user(request_factory, org_member):
+    access_token = factories.AccessToken(user=org_member)
+    refresh_token = factories.RefreshToken(user=org_member, access_token=access_token)
+    request = request_factory.get('')
+    data = RefreshTokenSerializer(refresh_token, context={'request': request}).data
+    # the user of both tokens is serialized only once
+    assert data['user'] is data['access_token']['user']
+    assert data['user']['username'] == org_member.username
+
+
+@pytest.mark.django_db()
+def test_core_user_profile_serializer_avatar_max_size(settings, org_member):
+    settings.AVATAR_MAX_UPLOAD_SIZE = 10
+    avatar = SimpleUploadedFile('avatar.png', b'0' * 11, content_type='image/png')
+    serializer = CoreUserProfileSerializer(org_member, data={'avatar': avatar}, partial=True)
+    assert not serializer.is_valid()
+    assert 'avatar' in serializer.errors
@@ -1,7 +1,6 @@
 from urllib.parse import urljoin
 
 from django.conf import settings
-from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.decorators import action
@@ -12,6 +11,7 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 
 from core.models import CoreUser, Organization
+from core.pagination import OptionalLimitOffsetPagination
 from core.serializers import (CoreUserSerializer, CoreUserWritableSerializer, CoreUserInvitationSerializer,
                               CoreUserResetPasswordSerializer, CoreUserResetPasswordCheckSerializer,
                               CoreUserResetPasswordConfirmSerializer, CoreUserEventInvitationSerializer,
@@ -19,8 +19,9 @@ from core.serializers import (CoreUserSerializer, CoreUserWritableSerializer, Co
 from core.permissions import AllowAuthenticatedRead, AllowOnlyOrgAdmin, IsOrgMember
 from core.swagger import (COREUSER_INVITE_RESPONSE, COREUSER_INVITE_CHECK_RESPONSE, COREUSER_RESETPASS_RESPONSE,
                           DETAIL_RESPONSE, SUCCESS_RESPONSE, TOKEN_QUERY_PARAM, COREUSER_INVITE_EVENT_CHECK_RESPONSE,)
-from core.jwt_utils import create_invitation_token, create_invitation_token_event
-from core.email_utils import send_email
+from core.jwt_utils import (create_invitation_tokens, create_invitation_tokens_event, decode_invitation_token,
+                            EVENT_INVITATION_TOKEN_CLAIMS)
+from core.email_utils import render_email, send_emails
 
 from rest_framework.permissions import AllowAny
 from ics import Calendar, Event, Organizer
@@ -53,8 +54,8 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
     Create a new core user instance.
     """
 
+    DEFAULT_SERIALIZER = CoreUserSerializer
     SERIALIZERS_MAP = {
-        'default': CoreUserSerializer,
         'create': CoreUserWritableSerializer,
         'update': CoreUserWritableSerializer,
         'partial_update': CoreUserWritableSerializer,
@@ -66,18 +67,32 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
         'update_profile': CoreUserProfileSerializer,
     }
 
+    # actions available without authentication, e.g. creating a new user or resetting password
+    PUBLIC_ACTIONS = frozenset(('create', 'reset_password', 'reset_password_check', 'reset_password_confirm',
+                                'invite_check', 'update_profile'))
+    ORG_ADMIN_ACTIONS = frozenset(('update', 'partial_update', 'invite'))
+    # the permission classes are stateless, so their instances are shared between requests
+    PUBLIC_PERMISSIONS = (permissions.AllowAny(),)
+    ORG_ADMIN_PERMISSIONS = (AllowOnlyOrgAdmin(), IsOrgMember())
+    # actions rendering the users with CoreUserSerializer, which need its related objects eager loaded
+    EAGER_LOADING_ACTIONS = frozenset(('list', 'retrieve'))
+
     def list(self, request, *args, **kwargs):
         # Use this queryset or the django-filters lib will not work
         queryset = self.filter_queryset(self.get_queryset())
         if not request.user.is_global_admin:
             organization_id = request.user.organization_id
             queryset = queryset.filter(organization_id=organization_id)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(instance=page, context={'request': request}, many=True)
+            return self.get_paginated_response(serializer.data)
         serializer = self.get_serializer(
             instance=queryset, context={'request': request}, many=True)
         return Response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
-        queryset = self.queryset
+        queryset = self.get_queryset()
         user = get_object_or_404(queryset, pk=kwargs.get('pk'))
         serializer = self.get_serializer(instance=user, context={'request': request})
         return Response(serializer.data)
@@ -141,67 +156,71 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
             return Response({'detail': 'No token is provided.'},
                             status.HTTP_401_UNAUTHORIZED)
         try:
-            decoded = jwt.decode(token, settings.SECRET_KEY,
-                                 algorithms='HS256')
+            decoded = decode_invitation_token(token)
         except jwt.DecodeError:
             return Response({'detail': 'Token is not valid.'},
                             status.HTTP_401_UNAUTHORIZED)
         except jwt.ExpiredSignatureError:
             return Response({'detail': 'Token is expired.'},
                             status.HTTP_401_UNAUTHORIZED)
+        except jwt.MissingRequiredClaimError:
+            return Response({'detail': 'Token is malformed.'},
+                            status.HTTP_401_UNAUTHORIZED)
 
         if CoreUser.objects.filter(email=decoded['email']).exists():
             return Response({'detail': 'Token has been used.'},
                             status.HTTP_401_UNAUTHORIZED)
 
-        organization = Organization.objects\
-            .values('organization_uuid', 'name')\
-            .get(organization_uuid=decoded['org_uuid']) \
-            if decoded['org_uuid'] else None
+        organization = Organization.get_summary(decoded['org_uuid']) if decoded['org_uuid'] else None
 
         return Response({
             'email': decoded['email'],
             'organization': organization
         }, status=status.HTTP_200_OK)
 
-    @transaction.atomic
     def perform_invite(self, serializer):
 
         reg_location = urljoin(settings.FRONTEND_URL,
                                settings.REGISTRATION_URL_PATH)
-        reg_location = reg_location + '?token={}'
-        email_addresses = serializer.validated_data.get('emails')
+        # resolve the link once, the URL-safe token is appended for each invitation
+        reg_location = self.request.build_absolute_uri(reg_location + '?token=')
+        # drop duplicated addresses keeping the requested order, so nobody gets invited twice
+        email_addresses = list(dict.fromkeys(serializer.validated_data.get('emails')))
         user = self.request.user
 
         organization = user.organization
-        registered_emails = CoreUser.objects.filter(email__in=email_addresses).values_list('email', flat=True)
+        registered_emails = set(CoreUser.objects.filter(email__in=email_addresses).values_list('email', flat=True))
+        new_emails = [email_address for email_address in email_addresses if email_address not in registered_emails]
+        if not new_emails:
+            return []
+
+        # the e-mail parts shared by all the invitations
+        base_context = {
+            'org_admin_name': user.name
+            if hasattr(user, 'coreuser') else '',
+            'organization_name': organization.name
+            if organization else ''
+        }
+        subject = 'Application Access'  # TODO we need to make this dynamic
+        template_name = 'email/coreuser/invitation.txt'
+        html_template_name = 'email/coreuser/invitation.html'
 
-        links = []
-        for email_address in email_addresses:
-            if email_address not in registered_emails:
-                # create or update an invitation
-
-                token = create_invitation_token(email_address, organization)
-
-                # build the invitation link
-                invitation_link = self.request.build_absolute_uri(
-                    reg_location.format(token)
-                )
-                links.append(invitation_link)
-
-                # create the used context for the E-mail templates
-                context = {
-                    'invitation_link': invitation_link,
-                    'org_admin_name': user.name
-                    if hasattr(user, 'coreuser') else '',
-                    'organization_name': organization.name
-                    if organization else ''
-                }
-                subject = 'Application Access'  # TODO we need to make this dynamic
-                template_name = 'email/coreuser/invitation.txt'
-                html_template_name = 'email/coreuser/invitation.html'
-                send_email(email_address, subject, context, template_name, html_template_name)
+        # create the invitations
+        tokens = create_invitation_tokens(new_emails, organization)
 
+        links = []
+        messages = []
+        for email_address, token in zip(new_emails, tokens):
+            # build the invitation link
+            invitation_link = reg_location + token
+            links.append(invitation_link)
+
+            # create the used context for the E-mail templates
+            context = {**base_context, 'invitation_link': invitation_link}
+            messages.append(render_email(email_address, subject, context, template_name, html_template_name))
+
+        # send all the invitations through one connection to the e-mail backend
+        send_emails(messages)
         return links
 
     @swagger_auto_schema(methods=['post'],
@@ -255,23 +274,21 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
             },
             status=status.HTTP_200_OK)
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if getattr(self, 'action', None) in self.EAGER_LOADING_ACTIONS:
+            return CoreUserSerializer.setup_eager_loading(queryset)
+        return queryset
+
     def get_serializer_class(self):
-        action_ = getattr(self, 'action', 'default')
-        return self.SERIALIZERS_MAP.get(action_, self.SERIALIZERS_MAP['default'])
+        return self.SERIALIZERS_MAP.get(getattr(self, 'action', None), self.DEFAULT_SERIALIZER)
 
     def get_permissions(self):
-        if hasattr(self, 'action'):
-            # different permissions when creating a new user or resetting password
-            if self.action in ['create',
-                               'reset_password',
-                               'reset_password_check',
-                               'reset_password_confirm',
-                               'invite_check',
-                               'update_profile']:
-                return [permissions.AllowAny()]
-
-            if self.action in ['update', 'partial_update', 'invite']:
-                return [AllowOnlyOrgAdmin(), IsOrgMember()]
+        action_ = getattr(self, 'action', None)
+        if action_ in self.PUBLIC_ACTIONS:
+            return self.PUBLIC_PERMISSIONS
+        if action_ in self.ORG_ADMIN_ACTIONS:
+            return self.ORG_ADMIN_PERMISSIONS
 
         return super(CoreUserViewSet, self).get_permissions()
 
@@ -279,6 +296,8 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
     filter_backends = (django_filters.rest_framework.DjangoFilterBackend,)
     queryset = CoreUser.objects.all()
     permission_classes = (AllowAuthenticatedRead,)
+    # the list is paginated only when the `limit` query parameter is given
+    pagination_class = OptionalLimitOffsetPagination
 
     # @transaction.atomic
 
@@ -302,6 +321,7 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
         end_date_time = request.data['end_date_time']
 
         invitation_link_list = []
+        messages = []
 
         c = Calendar()
         e = Event()
@@ -312,66 +332,51 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
         e.organizer = Organizer(common_name=str(organization_name), email=DEFAULT_FROM_EMAIL)
         c.events.add(e)
 
-        for email in emails:
-            user = CoreUser.objects.filter(email=email).first()
-            # if the user is registered
+        # the parts shared by all the invitations, registered users are sent to the login page
+        # and unregistered ones to the registration page
+        login_location = self.request.build_absolute_uri(
+            urljoin(settings.FRONTEND_URL, settings.EVENT_LOGIN_URL_PATH) + '?token='
+        )
+        registration_location = self.request.build_absolute_uri(
+            urljoin(settings.FRONTEND_URL, settings.EVENT_REGISTRATION_URL_PATH) + '?token='
+        )
+        base_context = {
+            'event_uuid': event_uuid,
+            'room_uuid': room_uuid,
+            'event_name': event_name
+        }
+        template_name = 'email/coreuser/invite_event.txt'
+        html_template_name = 'email/coreuser/invite_event.html'
+        attachment = str(c)
+
+        users_by_email = {}
+        for user in CoreUser.objects.select_related('organization').filter(email__in=emails):
+            # keep the first user in the default ordering when several of them share the e-mail address
+            users_by_email.setdefault(user.email, user)
+        invitees, locations = [], []
+        for email_address in emails:
+            user = users_by_email.get(email_address)
             if user:
-                """
-                for registered users send them a test email "Registered Users! Welcome to a new event at organization".
-                """
-                email_address = email
-                organization = str(user.organization)
-                reg_location = urljoin(settings.FRONTEND_URL,
-                                       settings.EVENT_LOGIN_URL_PATH)
-                reg_location = reg_location + '?token={}'
-                token = create_invitation_token_event(email_address, organization, room_uuid, event_uuid)
-                invitation_link = self.request.build_absolute_uri(
-                    reg_location.format(token)
-                )
-                invitation_link_list.append(invitation_link)
-                subject = 'Welcome to event {} at {}'.format(event_name, organization)
-                context = {
-                    'organization_name': organization,
-                    'event_link': invitation_link,
-                    'event_uuid': event_uuid,
-                    'room_uuid': room_uuid,
-                    'event_name': event_name
-                }
-                template_name = 'email/coreuser/invite_event.txt'
-                html_template_name = 'email/coreuser/invite_event.html'
-                send_email(email_address, subject, context, template_name, html_template_name, str(c))
-            # if the user is not registered
+                invitees.append((email_address, user.organization.name if user.organization_id else organization_name))
+                locations.append(login_location)
             else:
-                """
-                for unregistered users send them a test email "Unregistered Users!
-                Welcome to a new event at organization'".
-                """
-                email_address = email
-                organization = organization_name
-                reg_location = urljoin(settings.FRONTEND_URL,
-                                       settings.EVENT_REGISTRATION_URL_PATH)
-                reg_location = reg_location + '?token={}'
-                token = create_invitation_token_event(email_address, organization, room_uuid, event_uuid)
-                # build the invitation link
-                invitation_link = self.request.build_absolute_uri(
-                    reg_location.format(token)
-                )
-                invitation_link_list.append(invitation_link)
-                subject = 'Welcome to event {} at {}'.format(event_name, organization)
-                context = {
-                    'organization_name': organization,
-                    'event_link':  invitation_link,
-                    'event_uuid': event_uuid,
-                    'room_uuid': room_uuid,
-                    'event_name': event_name
-                }
-                template_name = 'email/coreuser/invite_event.txt'
-                html_template_name = 'email/coreuser/invite_event.html'
-                send_email(email_address, subject, context, template_name, html_template_name, str(c))
+                invitees.append((email_address, organization_name))
+                locations.append(registration_location)
+        tokens = create_invitation_tokens_event(invitees, room_uuid, event_uuid)
+
+        for (email_address, organization), reg_location, token in zip(invitees, locations, tokens):
+            # build the invitation link
+            invitation_link = reg_location + token
+            invitation_link_list.append(invitation_link)
+            subject = 'Welcome to event {} at {}'.format(event_name, organization)
+            context = {**base_context, 'organization_name': organization, 'event_link': invitation_link}
+            messages.append(render_email(email_address, subject, context, template_name, html_template_name,
+                                         attachment))
+        send_emails(messages)
         return Response(
             {
                 'detail': 'The invitations were sent successfully.',
-                'event_link': [invitation_link_list],
+                'event_link': invitation_link_list,
             }, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(methods=['get'],
@@ -389,14 +394,16 @@ class CoreUserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
             return Response({'detail': 'No token is provided.'},
                             status.HTTP_401_UNAUTHORIZED)
         try:
-            decoded = jwt.decode(token, settings.SECRET_KEY,
-                                 algorithms='HS256')
+            decoded = decode_invitation_token(token, EVENT_INVITATION_TOKEN_CLAIMS)
         except jwt.DecodeError:
             return Response({'detail': 'Token is not valid.'},
                             status.HTTP_401_UNAUTHORIZED)
         except jwt.ExpiredSignatureError:
             return Response({'detail': 'Token is expired.'},
                             status.HTTP_401_UNAUTHORIZED)
+        except jwt.MissingRequiredClaimError:
+            return Response({'detail': 'Token is malformed.'},
+                            status.HTTP_401_UNAUTHORIZED)
 
         return Response({
             'email': decoded['email'],
@@ -39,6 +39,9 @@ class AccessTokenViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
     queryset = AccessToken.objects.all()
     serializer_class = AccessTokenSerializer
 
+    def get_queryset(self):
+        return self.serializer_class.setup_eager_loading(super().get_queryset())
+
 
 class ApplicationViewSet(viewsets.ModelViewSet):
     """
@@ -110,3 +113,6 @@ class RefreshTokenViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
     permission_classes = (IsSuperUser,)
     queryset = RefreshToken.objects.all()
     serializer_class = RefreshTokenSerializer
+
+    def get_queryset(self):
+        return self.serializer_class.setup_eager_loading(super().get_queryset())
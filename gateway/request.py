@@ -124,7 +124,7 @@ class GatewayRequest(BaseGatewayRequest):
                     response = utils.get_swagger_from_url(schema_url)
                     spec_dict = response.json()
                     logic_module.api_specification = spec_dict
-                    logic_module.save()
+                    logic_module.save(update_fields=['api_specification', 'edit_date'])
 
             except URLError:
                 raise URLError(f'Make sure that {schema_url} is accessible.')
@@ -213,7 +213,7 @@ class AsyncGatewayRequest(BaseGatewayRequest):
                                 f'Failed to parse swagger schema from {schema_url}. Should be JSON.'
                             )
                     logic_module.api_specification = spec_dict
-                    logic_module.save()
+                    logic_module.save(update_fields=['api_specification', 'edit_date'])
                     swagger_spec = Spec.from_dict(spec_dict, config=self.SWAGGER_CONFIG)
                     self._specs[schema_url] = swagger_spec
         return self._specs[schema_url]
@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from core.admin import CoreGroupsFieldMixin
+
 from .models import WorkflowLevel1, WorkflowLevel2, WorkflowLevel2Sort, WorkflowTeam, WorkflowLevelStatus
 
 
@@ -11,7 +13,7 @@ class WorkflowTeamAdmin(admin.ModelAdmin):
     list_filter = ('create_date',)
 
 
-class WorkflowLevel1Admin(admin.ModelAdmin):
+class WorkflowLevel1Admin(CoreGroupsFieldMixin, admin.ModelAdmin):
     list_display = ('name',)
     display = 'Workflow Level1'
     list_filter = ('name',)
@@ -22,7 +24,7 @@ class WorkflowLevelStatusAdmin(admin.ModelAdmin):
     list_display = ('order', 'name', 'short_name')
 
 
-class WorkflowLevel2Admin(admin.ModelAdmin):
+class WorkflowLevel2Admin(CoreGroupsFieldMixin, admin.ModelAdmin):
     list_display = ('name', 'status')
     display = 'Workflow Level1'
     list_filter = ('name', 'status')
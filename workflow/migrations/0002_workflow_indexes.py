@@ -0,0 +1,25 @@
+# Generated by Django 2.2.13 on 2026-10-14 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workflowlevel1',
+            index=models.Index(fields=['organization', 'name'], name='workflow_wo_organiz_3eb5e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowlevel2',
+            index=models.Index(fields=['workflowlevel1', 'name'], name='workflow_wo_workflo_77ff37_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowteam',
+            index=models.Index(fields=['workflow_user', 'workflowlevel1'], name='workflow_wo_workflo_2dba6d_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 2.2.13 on 2026-10-14 10:40
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0002_workflow_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='workflowlevel1',
+            name='level1_uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='WorkflowLevel1 UUID'),
+        ),
+        migrations.AlterField(
+            model_name='workflowteam',
+            name='team_uuid',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='WorkflowLevel1 UUID'),
+        ),
+    ]
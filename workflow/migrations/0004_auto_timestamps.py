@@ -0,0 +1,84 @@
+# Generated by Django 2.2.13 on 2026-10-14 11:05
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0003_uuid_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='internationalization',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE workflow_internationalization SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='internationalization',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='workflowlevel1',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE workflow_workflowlevel1 SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='workflowlevel1',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='workflowlevel2',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Date Created'),
+        ),
+        migrations.RunSQL(
+            'UPDATE workflow_workflowlevel2 SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='workflowlevel2',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True, verbose_name='Last Edit Date'),
+        ),
+        migrations.AlterField(
+            model_name='workflowlevel2sort',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE workflow_workflowlevel2sort SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='workflowlevel2sort',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='workflowteam',
+            name='create_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunSQL(
+            'UPDATE workflow_workflowteam SET edit_date = COALESCE(create_date, now()) WHERE edit_date IS NULL',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='workflowteam',
+            name='edit_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-14 11:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0004_auto_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='internationalization',
+            index=models.Index(fields=['language'], name='workflow_in_languag_4f9db1_idx'),
+        ),
+    ]
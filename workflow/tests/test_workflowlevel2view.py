@@ -29,6 +29,11 @@ class WorkflowLevel2ListViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data['results']), 2)
 
+    def test_workflowlevel2_queryset_joins_organization(self):
+        with self.assertNumQueries(1):
+            organizations = [wfl2.organization for wfl2 in WorkflowLevel2ViewSet.queryset.all()]
+        self.assertEqual(organizations, [self.not_default_org] * 2)
+
     def test_list_workflowlevel2_org_admin(self):
         request = self.factory.get(reverse('workflowlevel2-list'))
         group_org_admin = factories.CoreGroup(name='Org Admin', is_org_level=True,
@@ -68,7 +68,7 @@ class WorkflowLevel2ViewSet(viewsets.ModelViewSet):
         filters.OrderingFilter
     )
     filter_class = WorkflowLevel2Filter
-    queryset = WorkflowLevel2.objects.all()
+    queryset = WorkflowLevel2.objects.select_related('workflowlevel1__organization')
     permission_classes = (CoreGroupsPermissions, IsOrgMember)
     serializer_class = WorkflowLevel2Serializer
     pagination_class = DefaultLimitOffsetPagination
@@ -98,8 +98,7 @@ class WorkflowLevel2SortViewSet(viewsets.ModelViewSet):
         # Use this queryset or the django-filters lib will not work
         queryset = self.filter_queryset(self.get_queryset())
         if not request.user.is_global_admin:
-            user_groups = request.user.groups.values_list('name', flat=True)
-            if ROLE_ORGANIZATION_ADMIN in user_groups:
+            if request.user.groups.filter(name=ROLE_ORGANIZATION_ADMIN).exists():
                 organization_id = request.user.organization_id
                 queryset = queryset.filter(
                     workflowlevel1__organization_id=organization_id)
@@ -111,6 +110,6 @@ class WorkflowLevel2SortViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
-    queryset = WorkflowLevel2Sort.objects.all()
+    queryset = WorkflowLevel2Sort.objects.select_related('workflowlevel1__organization')
     permission_classes = (IsOrgMember,)
     serializer_class = WorkflowLevel2SortSerializer